@@ -0,0 +1,131 @@
+import numpy as np
+import numba
+from numba import types
+
+# Explicit signature: compiled eagerly at import (or loaded from the on-disk
+# cache), so no call ever pays for type inference or dispatch on new types
+AMORTIZE_SIGNATURE = types.Tuple((types.float64[:, :], types.int64, types.float64))(
+    types.float64, types.float64, types.float64, types.float64, types.int64
+)
+
+
+@numba.njit(types.float64(types.float64, types.float64, types.int64), cache=True)
+def pmt(loan_amount, monthly_rate, period_months):
+    """Standard monthly payment (PMT formula), shared by the app and the sweep."""
+    if monthly_rate > 0:
+        # P = L*r / (1 - (1+r)^-n), with 1 - e^x taken as -expm1(x) to avoid cancellation
+        return loan_amount * monthly_rate / -np.expm1(-period_months * np.log1p(monthly_rate))
+    return loan_amount / period_months
+
+
+@numba.njit(AMORTIZE_SIGNATURE, cache=True, fastmath=True)
+def amortize(loan_amount, monthly_rate, monthly_payment, extra_payment_amount, max_months):
+    """Compiled amortization loop.
+
+    Returns a (5, max_months) array whose rows are the payment, principal,
+    interest, extra payment and remaining balance columns, plus the month
+    count and total interest.
+    """
+    out = np.empty((5, max_months), dtype=np.float64)
+    balance = loan_amount
+    total_interest = 0.0
+    months_count = 0
+
+    # Outer loop over years, inner loop over months: the extra payment is
+    # applied after each full year instead of testing month % 12 every month
+    for year in range((max_months + 11) // 12):
+        months_in_year = min(12, max_months - months_count)
+
+        for m in range(months_in_year):
+            i = months_count
+            months_count += 1
+
+            # Interest for this month
+            interest = balance * monthly_rate
+            total_interest += interest
+
+            # Principal for this month
+            payment = monthly_payment
+            principal_payment = payment - interest
+
+            # Check if this is the final payment (sub-micro-euro residuals are rounding noise)
+            if balance < principal_payment + 1e-6:
+                principal_payment = balance
+                payment = interest + principal_payment
+
+            balance -= principal_payment
+
+            out[0, i] = payment
+            out[1, i] = principal_payment
+            out[2, i] = interest
+            out[3, i] = 0.0
+            out[4, i] = balance
+
+            if balance <= 0:
+                break
+
+        if balance <= 0 or months_in_year < 12:
+            break
+
+        # Yearly Extra Payment Logic
+        if extra_payment_amount > 0:
+            actual_extra_payment = min(balance, extra_payment_amount)
+            balance -= actual_extra_payment
+            out[3, months_count - 1] = actual_extra_payment
+            out[4, months_count - 1] = balance
+
+            if balance <= 0:
+                break
+
+    return out, months_count, total_interest
+
+
+@numba.njit(cache=True, fastmath=True)
+def _total_interest(loan_amount, monthly_rate, extra_payment_amount, period_months):
+    """Total interest paid for one scenario, without materializing a schedule.
+
+    Returns NaN if the balance is not cleared within period_months + 1200
+    months, rather than a partial sum.
+    """
+    monthly_payment = pmt(loan_amount, monthly_rate, period_months)
+
+    # Without extra payments every month pays P, as in build_schedule's closed
+    # form; a float loop drifts off the true balance at high rate x term
+    if extra_payment_amount == 0:
+        if monthly_rate == 0:
+            return 0.0
+        return monthly_payment * period_months - loan_amount
+
+    balance = loan_amount
+    total_interest = 0.0
+
+    for year in range((period_months + 1200 + 11) // 12):
+        for m in range(12):
+            interest = balance * monthly_rate
+            total_interest += interest
+
+            principal_payment = monthly_payment - interest
+            if balance < principal_payment + 1e-6:
+                return total_interest
+            balance -= principal_payment
+
+        # Yearly Extra Payment Logic
+        balance -= extra_payment_amount
+        if balance <= 0:
+            return total_interest
+
+    return np.nan
+
+
+@numba.njit(parallel=True, cache=True, fastmath=True)
+def sweep(rates, extras, loan_amount, period_months):
+    """Total interest for every (monthly rate, yearly extra payment) pair.
+
+    Rows follow ``rates`` and columns follow ``extras``; rates are spread
+    across threads with prange.
+    """
+    out = np.empty((len(rates), len(extras)), dtype=np.float64)
+    for i in numba.prange(len(rates)):
+        for j in range(len(extras)):
+            out[i, j] = _total_interest(loan_amount, rates[i], extras[j], period_months)
+    return out
@@ -0,0 +1,216 @@
+import streamlit as st
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv
+import numpy as np
+import math
+
+from kernels import amortize, pmt
+
+# Euro formatting is applied by the frontend for every table size, so the
+# schedule never goes through a pandas Styler. Built once at import.
+CURRENCY_COLUMNS = {
+    "Monthly Payment": st.column_config.NumberColumn(format="€%.2f"),
+    "Principal": st.column_config.NumberColumn(format="€%.2f"),
+    "Interest": st.column_config.NumberColumn(format="€%.2f"),
+    "Yearly Extra Payment": st.column_config.NumberColumn(format="€%.2f"),
+    "Remaining Balance": st.column_config.NumberColumn(format="€%.2f")
+}
+
+
+def payoff_month(loan_amount, monthly_rate, monthly_payment, extra):
+    """Return the month in which the loan is paid off.
+
+    Within each 12-month block the months left on balance B solve
+    n = log(P / (P - r*B)) / log(1 + r), so this steps one block per
+    iteration instead of one month. When P - r*B rounds to zero or below (very
+    high rate x term), there is no solution and the whole block is stepped.
+    """
+    balance = loan_amount
+    months = 0
+    growth = math.exp(12 * math.log1p(monthly_rate))
+
+    while True:
+        if monthly_rate > 0:
+            headroom = monthly_payment - monthly_rate * balance
+            if headroom > 0:
+                remaining = math.log(monthly_payment / headroom) / math.log1p(monthly_rate)
+            else:
+                remaining = math.inf
+        else:
+            remaining = balance / monthly_payment
+        if remaining <= 12:
+            # Shave off floating-point noise so an exact payoff isn't rounded up a month
+            return months + math.ceil(remaining - 1e-9)
+
+        # Balance after this block, then the yearly extra payment
+        months += 12
+        if monthly_rate > 0:
+            balance = balance * growth - monthly_payment * (growth - 1) / monthly_rate
+        else:
+            balance -= monthly_payment * 12
+        balance -= extra
+        if balance <= 0:
+            return months
+
+
+def build_schedule(loan_amount, monthly_rate, monthly_payment, period_months, extra):
+    """Compute the amortization schedule as a PyArrow table.
+
+    Without a yearly extra payment the schedule is fully determined by the PMT
+    formula, so it is filled in closed form with NumPy and the kernel is skipped.
+
+    Each column is a contiguous float64 array, so the table wraps the columns
+    without copying.
+    """
+    if extra == 0:
+        months_count = int(period_months)
+        months = np.arange(1, months_count + 1)
+        if monthly_rate > 0:
+            # Remaining-annuity form B_k = P*(1 - (1+r)^-(n-k))/r: unlike
+            # L*(1+r)^k - P*((1+r)^k - 1)/r it never subtracts two huge,
+            # nearly equal terms, so it stays accurate at high rate x term
+            balance = monthly_payment * -np.expm1(-(months_count - months) * math.log1p(monthly_rate)) / monthly_rate
+        else:
+            balance = loan_amount - monthly_payment * months
+
+        interest = np.empty_like(balance)
+        interest[0] = loan_amount * monthly_rate
+        interest[1:] = balance[:-1] * monthly_rate
+        principal = monthly_payment - interest
+        payment = np.full_like(balance, monthly_payment)
+
+        # Final payment clears exactly what is left
+        principal[-1] = balance[-2] if months_count > 1 else loan_amount
+        payment[-1] = interest[-1] + principal[-1]
+        balance[-1] = 0.0
+
+        total_interest = interest.sum()
+        out = np.array((payment, principal, interest, np.zeros_like(balance), balance))
+    else:
+        # One month of slack absorbs rounding in the analytic payoff month
+        max_months = payoff_month(loan_amount, monthly_rate, monthly_payment, extra) + 1
+        out, months_count, total_interest = amortize(
+            float(loan_amount), float(monthly_rate), float(monthly_payment), float(extra), max_months
+        )
+        out = out[:, :months_count]
+
+    table = pa.table({
+        "Month": np.arange(1, months_count + 1, dtype=np.int32),
+        "Monthly Payment": out[0],
+        "Principal": out[1],
+        "Interest": out[2],
+        "Yearly Extra Payment": out[3],
+        "Remaining Balance": out[4]
+    })
+    return table, total_interest, months_count
+
+
+@st.cache_data(max_entries=32)
+def compute_schedule(loan_amount, annual_interest_rate, period_months, yearly_extra_payment_percent):
+    """Compute the schedule for the given inputs, memoized across reruns."""
+    # 1. Basic Calculations
+    monthly_rate = (annual_interest_rate / 100) / 12
+
+    # Calculate standard monthly payment (PMT formula)
+    monthly_payment = pmt(float(loan_amount), float(monthly_rate), int(period_months))
+
+    extra_payment_amount = loan_amount * (yearly_extra_payment_percent / 100)
+
+    # 2. Amortization Schedule
+    return build_schedule(loan_amount, monthly_rate, monthly_payment, period_months, extra_payment_amount)
+
+
+def to_csv_bytes(table):
+    """Encode the schedule as UTF-8 CSV with Arrow's C++ writer.
+
+    Amounts are rounded to cents first. Not memoized: Arrow tables can't be
+    hashed by st.cache_data, and the download only encodes on click anyway.
+    """
+    rounded = pa.table({
+        name: pc.round(column, 2) if pa.types.is_floating(column.type) else column
+        for name, column in zip(table.column_names, table.columns)
+    })
+    buf = pa.BufferOutputStream()
+    pa.csv.write_csv(rounded, buf, write_options=pa.csv.WriteOptions(include_header=True))
+    return buf.getvalue().to_pybytes()
+
+
+def yearly_summary(table):
+    """Aggregate the monthly schedule into per-year totals.
+
+    The columns are summed as a (years, 12) reshape of the underlying arrays,
+    with the final partial year zero-padded, rather than via a groupby.
+
+    Nothing in the app calls this yet; it is groundwork for a yearly view.
+    """
+    months_count = table.num_rows
+    years = -(-months_count // 12)
+
+    def per_year(column):
+        padded = np.zeros(years * 12, dtype=np.float64)
+        padded[:months_count] = table[column].to_numpy()
+        return padded.reshape(-1, 12).sum(axis=1)
+
+    # Balance at the end of each year (or at payoff for the final year)
+    balance = table["Remaining Balance"].to_numpy()
+    year_end = np.minimum(np.arange(12, years * 12 + 1, 12), months_count) - 1
+
+    return pa.table({
+        "Year": np.arange(1, years + 1, dtype=np.int32),
+        "Principal": per_year("Principal"),
+        "Interest": per_year("Interest"),
+        "Yearly Extra Payment": per_year("Yearly Extra Payment"),
+        "Remaining Balance": balance[year_end]
+    })
+
+
+def render_summary(total_interest, months_count, period_months):
+    """Show total interest, time to repay and time saved."""
+    # --- Summary Section ---
+    st.divider()
+    st.subheader("📊 Loan Summary")
+    
+    # Use standard columns, they stack automatically on mobile
+    col1, col2, col3 = st.columns(3)
+    
+    original_years = period_months / 12
+    actual_years = months_count / 12
+    years_saved = max(0, original_years - actual_years)
+
+    years_repaid = math.floor(months_count / 12)
+    months_repaid = months_count % 12
+    time_repaid_str = f"{years_repaid} Years, {months_repaid} Months"
+
+    with col1:
+        st.metric("Total Interest", f"€{total_interest:,.2f}")
+    with col2:
+        st.metric("Time to Repay", time_repaid_str)
+    with col3:
+        st.metric("Time Saved", f"{years_saved:.1f} Years")
+
+
+def render_schedule(table):
+    """Show the amortization table with its CSV download."""
+    # --- Table & Export Section ---
+    st.divider()
+    st.subheader("📅 Amortization Schedule")
+    
+    # Deferred: the CSV is only encoded when the button is actually clicked
+    st.download_button(
+        label="📥 Download CSV",
+        data=lambda: to_csv_bytes(table),
+        file_name='amortization_schedule.csv',
+        mime='text/csv',
+        use_container_width=True # Makes button full width on mobile
+    )
+
+    # Arrow tables are sent to the frontend as-is, without a pandas round-trip
+    st.dataframe(
+        table,
+        column_config=CURRENCY_COLUMNS,
+        hide_index=True,
+        use_container_width=True,
+        height=500
+    )
+
@@ -0,0 +1,109 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from kernels import amortize, pmt, sweep
+from loan_core import compute_schedule, yearly_summary
+
+
+def reference_schedule(loan_amount, annual_interest_rate, period_months):
+    """Plain month-by-month loop in exact arithmetic, for schedules without extra payments.
+
+    Returns the total interest and the remaining balance after each month.
+    """
+    monthly_rate = Fraction(annual_interest_rate) / 100 / 12
+    growth = (1 + monthly_rate) ** period_months
+    monthly_payment = Fraction(loan_amount) * monthly_rate * growth / (growth - 1)
+
+    balance = Fraction(loan_amount)
+    total_interest = Fraction(0)
+    balances = []
+    for month in range(period_months):
+        interest = balance * monthly_rate
+        total_interest += interest
+        balance -= monthly_payment - interest
+        balances.append(float(balance))
+
+    return float(total_interest), balances
+
+
+@pytest.mark.parametrize("loan_amount, annual_interest_rate, period_months", [
+    (10000.0, 5.0, 60),
+    (250000.0, 3.5, 360),
+    (10000.0, 200.0, 360),
+    (10000.0, 100.0, 480),
+    (10000.0, 80.0, 600),
+    (1000.0, 100.0, 1200),
+])
+def test_closed_form_schedule_matches_monthly_loop(loan_amount, annual_interest_rate, period_months):
+    table, total_interest, months_count = compute_schedule(loan_amount, annual_interest_rate, period_months, 0.0)
+    expected_interest, expected_balances = reference_schedule(loan_amount, annual_interest_rate, period_months)
+
+    assert months_count == period_months
+    assert total_interest == pytest.approx(expected_interest, rel=1e-9)
+
+    balances = table["Remaining Balance"].to_pylist()
+    assert min(balances) >= 0
+    assert balances == pytest.approx(expected_balances, rel=1e-6, abs=1e-6 * loan_amount)
+
+
+@pytest.mark.parametrize("loan_amount, annual_interest_rate, period_months, yearly_extra_payment_percent", [
+    (10000.0, 80.0, 600, 1.0),
+    (10000.0, 100.0, 480, 1.0),
+    (10000.0, 150.0, 360, 1.0),
+    (1000.0, 500.0, 360, 1.0),
+    (250000.0, 3.5, 360, 2.0),
+])
+def test_extra_payment_schedule_is_not_truncated(loan_amount, annual_interest_rate, period_months, yearly_extra_payment_percent):
+    # At high rate x term the payment barely exceeds the interest, so the analytic
+    # payoff month has no solution for the first block
+    table, total_interest, months_count = compute_schedule(
+        loan_amount, annual_interest_rate, period_months, yearly_extra_payment_percent
+    )
+
+    monthly_rate = (annual_interest_rate / 100) / 12
+    monthly_payment = pmt(loan_amount, monthly_rate, period_months)
+    extra = loan_amount * (yearly_extra_payment_percent / 100)
+    _, expected_months, expected_interest = amortize(
+        loan_amount, monthly_rate, monthly_payment, extra, period_months + 1200
+    )
+
+    assert months_count == expected_months
+    assert total_interest == pytest.approx(expected_interest, rel=1e-12)
+    assert table["Remaining Balance"][-1].as_py() == 0
+
+
+def test_yearly_summary_sums_each_year():
+    table, total_interest, months_count = compute_schedule(10000.0, 5.0, 60, 3.0)
+    yearly = yearly_summary(table)
+
+    interest = table["Interest"].to_pylist()
+    balance = table["Remaining Balance"].to_pylist()
+    expected_interest = [sum(interest[start:start + 12]) for start in range(0, months_count, 12)]
+
+    assert yearly["Year"].to_pylist() == list(range(1, len(expected_interest) + 1))
+    assert yearly["Interest"].to_pylist() == pytest.approx(expected_interest)
+    assert yearly["Remaining Balance"].to_pylist()[-1] == balance[-1] == 0
+
+
+@pytest.mark.parametrize("loan_amount, period_months, annual_rates", [
+    (10000.0, 60, [0.1, 3.0, 5.0, 12.5]),
+    (250000.0, 360, [0.1, 3.0, 5.0, 12.5]),
+    (10000.0, 7, [0.1, 3.0, 5.0, 12.5]),
+    (10000.0, 360, [100.0, 200.0]),
+    (10000.0, 480, [100.0]),
+    (10000.0, 600, [80.0]),
+])
+def test_sweep_matches_compute_schedule(loan_amount, period_months, annual_rates):
+    annual_rates = np.array(annual_rates)
+    extra_percents = np.array([0.0, 1.0, 5.0, 100.0])
+
+    totals = sweep(annual_rates / 100 / 12, loan_amount * (extra_percents / 100), loan_amount, period_months)
+
+    for i, annual_interest_rate in enumerate(annual_rates):
+        for j, yearly_extra_payment_percent in enumerate(extra_percents):
+            _, total_interest, _ = compute_schedule(
+                loan_amount, float(annual_interest_rate), period_months, float(yearly_extra_payment_percent)
+            )
+            assert totals[i, j] == pytest.approx(total_interest, rel=1e-9)